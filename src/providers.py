@@ -1,6 +1,8 @@
 """Enhanced provider support with direct integrations for OpenRouter, OpenAI, and Ollama."""
 
-from typing import Union
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Union
+
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.models.openrouter import OpenRouterModel
 from pydantic_ai.providers.openai import OpenAIProvider
@@ -15,20 +17,46 @@ def get_llm_model() -> Union[OpenAIChatModel, OpenRouterModel]:
     Returns the appropriate model based on the configured provider.
     Supports OpenRouter, OpenAI, and Ollama.
 
+    The constructed model is memoized per settings fingerprint, so repeated
+    callers reuse one model (and one underlying HTTP client) instead of
+    rebuilding them per call.
+
     Returns:
         Configured model with provider-specific integration
     """
     settings = load_settings()
-    provider = settings.llm_provider
-
-    if provider == 'openrouter':
-        return _create_openrouter_model(settings)
-    elif provider == 'openai':
-        return _create_openai_model(settings)
-    elif provider == 'ollama':
-        return _create_ollama_model(settings)
-    else:
+    return _build_llm_model(
+        settings.llm_provider,
+        settings.llm_model,
+        settings.llm_base_url,
+        settings.llm_api_key,
+        settings.openrouter_app_url,
+        settings.openrouter_app_title,
+    )
+
+
+@lru_cache(maxsize=4)
+def _build_llm_model(
+    provider: str,
+    model: str,
+    base_url: Optional[str],
+    api_key: str,
+    app_url: Optional[str],
+    app_title: Optional[str],
+) -> Union[OpenAIChatModel, OpenRouterModel]:
+    """
+    Build the provider model once per configuration fingerprint.
+
+    The arguments are the hashable fingerprint of the Settings fields that
+    influence model construction; they serve as the lru_cache key. The actual
+    field values are read from the cached Settings instance.
+    """
+    settings = load_settings()
+
+    factory = _PROVIDER_FACTORIES.get(provider)
+    if factory is None:
         raise ValueError(f"Unsupported provider: {provider}")
+    return factory(settings)
 
 
 def _create_openrouter_model(settings: Settings) -> OpenRouterModel:
@@ -84,6 +112,15 @@ def _create_ollama_model(settings: Settings) -> OpenAIChatModel:
     return OpenAIChatModel(settings.llm_model, provider=provider)
 
 
+# Provider name -> model factory. Single O(1) dispatch point shared by
+# get_llm_model; extend here when adding a provider.
+_PROVIDER_FACTORIES: Dict[str, Callable[[Settings], Union[OpenAIChatModel, OpenRouterModel]]] = {
+    'openrouter': _create_openrouter_model,
+    'openai': _create_openai_model,
+    'ollama': _create_ollama_model,
+}
+
+
 def get_model_info() -> dict:
     """
     Get information about current model configuration.
@@ -100,16 +137,26 @@ def get_model_info() -> dict:
     }
 
 
-def validate_llm_configuration() -> bool:
+def validate_llm_configuration(deep: bool = False) -> bool:
     """
     Validate that LLM configuration is properly set.
 
+    By default this only runs the (cached) settings validation, which is
+    cheap enough for per-request health checks. Pass deep=True to also
+    construct the configured model.
+
+    Args:
+        deep: Also build the model instance to exercise provider integration
+
     Returns:
         True if configuration is valid
     """
     try:
-        # Check if we can create a model instance
-        get_llm_model()
+        settings = load_settings()
+        if settings.llm_provider not in _PROVIDER_FACTORIES:
+            raise ValueError(f"Unsupported provider: {settings.llm_provider}")
+        if deep:
+            get_llm_model()
         return True
     except Exception as e:
         print(f"LLM configuration validation failed: {e}")
@@ -1,20 +1,43 @@
 """Settings configuration for Skill-Based Agent."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings
 from pydantic import Field, ConfigDict
 from dotenv import load_dotenv
 from typing import Optional, Literal
 
-# Load environment variables from .env file
-load_dotenv()
+# Whether .env has been loaded into the environment (done lazily on first
+# load_settings call, so importing this module stays side-effect free)
+_DOTENV_LOADED = False
+
+
+def _ensure_dotenv() -> None:
+    """
+    Load .env into the environment once, on first settings access.
+
+    Set SKIP_DOTENV in the environment to skip entirely (e.g. in containers
+    where configuration is injected by the orchestrator).
+    """
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED or os.environ.get("SKIP_DOTENV"):
+        return
+    load_dotenv(override=False)
+    _DOTENV_LOADED = True
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
 
+    # frozen=True keeps the shared cached instance immutable and makes it
+    # hashable, so Settings itself can serve as a cache key downstream
     model_config = ConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True,
     )
 
     # Skills Configuration
@@ -70,8 +93,17 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Load settings with proper error handling."""
+    """
+    Load settings with proper error handling.
+
+    The result is cached for the lifetime of the process, so repeated callers
+    (providers, CLI, health checks) share one validated Settings instance
+    instead of re-parsing .env and re-running validation each time.
+    Use reload_settings() to force a fresh read.
+    """
+    _ensure_dotenv()
     try:
         return Settings()
     except Exception as e:
@@ -79,3 +111,14 @@ def load_settings() -> Settings:
         if "llm_api_key" in str(e).lower():
             error_msg += "\nMake sure to set LLM_API_KEY in your .env file"
         raise ValueError(error_msg) from e
+
+
+def reload_settings() -> Settings:
+    """
+    Clear the settings cache and re-read configuration from the environment.
+
+    Returns:
+        Freshly loaded Settings instance
+    """
+    load_settings.cache_clear()
+    return load_settings()
@@ -1,24 +1,59 @@
 """Settings configuration for Skill-Based Agent (with AWS Bedrock support)."""
 
+import os
+from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Optional
 
 from dotenv import load_dotenv
-from pydantic import Field, ConfigDict, model_validator
+from pydantic import Field, ConfigDict, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
-# Load environment variables from .env file
-load_dotenv()
+
+class Provider(StrEnum):
+    """Supported LLM providers.
+
+    A StrEnum keeps env-var round-tripping and display identical to the old
+    string literals while giving dispatch tables hashed enum members to key
+    on.
+    """
+
+    OPENROUTER = "openrouter"
+    OPENAI = "openai"
+    OLLAMA = "ollama"
+    BEDROCK = "bedrock"
+
+# Whether .env has been loaded into the environment (done lazily on first
+# load_settings call, so importing this module stays side-effect free)
+_DOTENV_LOADED = False
+
+
+def _ensure_dotenv() -> None:
+    """
+    Load .env into the environment once, on first settings access.
+
+    Set SKIP_DOTENV in the environment to skip entirely (e.g. in containers
+    where configuration is injected by the orchestrator).
+    """
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED or os.environ.get("SKIP_DOTENV"):
+        return
+    load_dotenv(override=False)
+    _DOTENV_LOADED = True
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
 
+    # frozen=True keeps the shared cached instance immutable and makes it
+    # hashable, so Settings itself can serve as a cache key downstream
     model_config = ConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,   # allows LLM_PROVIDER or llm_provider
         extra="ignore",
+        frozen=True,
     )
 
     # ---------------------
@@ -32,8 +67,8 @@ class Settings(BaseSettings):
     # ---------------------------------
     # LLM Configuration (multi-provider)
     # ---------------------------------
-    llm_provider: Literal["openrouter", "openai", "ollama", "bedrock"] = Field(
-        default="openrouter",
+    llm_provider: Provider = Field(
+        default=Provider.OPENROUTER,
         description="LLM provider to use",
     )
 
@@ -77,6 +112,13 @@ class Settings(BaseSettings):
         default=None,
         description="AWS profile name (optional). If set, AWS SDK will use this profile.",
     )
+    bedrock_latency_optimized: bool = Field(
+        default=False,
+        description=(
+            "Request Bedrock latency-optimized inference (roughly halves "
+            "Claude response latency on supported models/regions)."
+        ),
+    )
 
     # ---------------------
     # Application Settings
@@ -103,38 +145,75 @@ class Settings(BaseSettings):
     # -----------------------------
     # Provider-specific validation
     # -----------------------------
+    @field_validator("llm_provider", mode="before")
+    @classmethod
+    def _normalize_provider(cls, value: object) -> object:
+        """Map provider strings to the enum case-insensitively."""
+        if isinstance(value, str):
+            return value.lower()
+        return value
+
     @model_validator(mode="after")
     def _validate_provider_requirements(self):
-        provider = (self.llm_provider or "").lower()
-
-        if provider in ("openai", "openrouter"):
-            if not self.llm_api_key:
-                raise ValueError(
-                    f"llm_api_key is required when llm_provider={provider}. "
-                    "Set LLM_API_KEY in your .env."
-                )
-
-        if provider == "bedrock":
-            if not self.aws_region:
-                raise ValueError(
-                    "aws_region is required when llm_provider=bedrock. "
-                    "Set AWS_REGION in your .env (e.g., ap-southeast-1)."
-                )
-            # For Bedrock, ensure model id looks like a Bedrock Anthropic model
-            # e.g., 'anthropic.claude-3-5-sonnet-20241022-v2:0'
-            if not self.llm_model or "anthropic." not in self.llm_model:
-                # Relax/change this if you support other Bedrock providers
-                raise ValueError(
-                    "llm_model should be a valid Bedrock model id for Anthropic, "
-                    "e.g., 'anthropic.claude-3-5-sonnet-20241022-v2:0'. "
-                    "Update LLM_MODEL in your .env."
-                )
-
+        _PROVIDER_RULES.get(self.llm_provider, _no_requirements)(self)
         return self
 
 
+def _no_requirements(settings: "Settings") -> None:
+    """Providers with no extra configuration requirements (e.g. Ollama)."""
+
+
+def _require_api_key(settings: "Settings") -> None:
+    """OpenAI/OpenRouter need an API key."""
+    if not settings.llm_api_key:
+        raise ValueError(
+            f"llm_api_key is required when llm_provider={settings.llm_provider}. "
+            "Set LLM_API_KEY in your .env."
+        )
+
+
+# Valid Bedrock Anthropic model-id prefixes, including cross-region
+# inference profiles (us./eu./apac.). Extend when supporting other vendors.
+_BEDROCK_PREFIXES = ("anthropic.", "us.anthropic.", "eu.anthropic.", "apac.anthropic.")
+
+
+def _require_bedrock(settings: "Settings") -> None:
+    """Bedrock needs an AWS region and an Anthropic Bedrock model id."""
+    if not settings.aws_region:
+        raise ValueError(
+            "aws_region is required when llm_provider=bedrock. "
+            "Set AWS_REGION in your .env (e.g., ap-southeast-1)."
+        )
+    # For Bedrock, ensure model id looks like a Bedrock Anthropic model
+    # e.g., 'anthropic.claude-3-5-sonnet-20241022-v2:0'
+    if not settings.llm_model or not settings.llm_model.startswith(_BEDROCK_PREFIXES):
+        raise ValueError(
+            "llm_model should be a valid Bedrock model id for Anthropic, "
+            "e.g., 'anthropic.claude-3-5-sonnet-20241022-v2:0'. "
+            "Update LLM_MODEL in your .env."
+        )
+
+
+# Provider name -> configuration rule, dispatched from the model validator.
+# Extend here when adding a provider-specific requirement.
+_PROVIDER_RULES = {
+    Provider.OPENAI: _require_api_key,
+    Provider.OPENROUTER: _require_api_key,
+    Provider.BEDROCK: _require_bedrock,
+}
+
+
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Load settings with proper error handling."""
+    """
+    Load settings with proper error handling.
+
+    The result is cached for the lifetime of the process, so repeated callers
+    (providers, CLI, health checks) share one validated Settings instance
+    instead of re-parsing .env and re-running validation each time.
+    Use reload_settings() to force a fresh read.
+    """
+    _ensure_dotenv()
     try:
         return Settings()
     except Exception as e:
@@ -146,3 +225,14 @@ def load_settings() -> Settings:
         if "aws_region" in lower or "bedrock" in lower:
             error_msg += "\nFor Bedrock, set AWS_REGION and a valid Bedrock LLM_MODEL in your .env."
         raise ValueError(error_msg) from e
+
+
+def reload_settings() -> Settings:
+    """
+    Clear the settings cache and re-read configuration from the environment.
+
+    Returns:
+        Freshly loaded Settings instance
+    """
+    load_settings.cache_clear()
+    return load_settings()
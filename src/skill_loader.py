@@ -1,12 +1,20 @@
 """Skill loader for discovering and managing skills with progressive disclosure."""
 
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 from pydantic import BaseModel, Field
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; same
+# safe-loading semantics, much faster tokenization than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +28,16 @@ class SkillMetadata(BaseModel):
     skill_path: Path = Field(..., description="Path to skill directory")
 
 
+# Parsed frontmatter keyed by (path, mtime_ns, size); lets repeat discoveries
+# over an unchanged tree skip the read + YAML parse + validation for each file
+_PARSE_CACHE: Dict[Tuple[str, int, int], SkillMetadata] = {}
+
+
+def clear_parse_cache() -> None:
+    """Drop all cached frontmatter so the next discovery re-parses every file."""
+    _PARSE_CACHE.clear()
+
+
 class SkillLoader:
     """Loads and manages skills from filesystem."""
 
@@ -46,22 +64,28 @@ class SkillLoader:
             logger.warning(f"skills_directory_missing: path={self.skills_dir}")
             return discovered
 
-        # Scan for skill directories
-        for skill_dir in self.skills_dir.iterdir():
-            if not skill_dir.is_dir():
-                continue
-
-            skill_md = skill_dir / "SKILL.md"
-            if not skill_md.exists():
-                logger.debug(f"skill_md_missing: dir={skill_dir.name}")
-                continue
-
-            # Parse skill metadata
-            metadata = self._parse_skill_metadata(skill_md, skill_dir)
-            if metadata:
-                self.skills[metadata.name] = metadata
-                discovered.append(metadata)
-                logger.info(f"skill_discovered: name={metadata.name}, version={metadata.version}")
+        # Scan for skill directories; scandir's DirEntry carries cached type
+        # info, so each child costs one syscall instead of a stat per check
+        with os.scandir(self.skills_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+
+                skill_md = Path(entry.path) / "SKILL.md"
+                try:
+                    stat = os.stat(skill_md)
+                except FileNotFoundError:
+                    logger.debug(f"skill_md_missing: dir={entry.name}")
+                    continue
+
+                # Parse skill metadata
+                metadata = self._parse_skill_metadata(
+                    skill_md, Path(entry.path), stat=stat
+                )
+                if metadata:
+                    self.skills[metadata.name] = metadata
+                    discovered.append(metadata)
+                    logger.info(f"skill_discovered: name={metadata.name}, version={metadata.version}")
 
         logger.info(f"skill_discovery_completed: count={len(discovered)}")
         return discovered
@@ -83,7 +107,7 @@ class SkillLoader:
         return "\n".join(lines)
 
     def _parse_skill_metadata(
-        self, skill_md: Path, skill_dir: Path
+        self, skill_md: Path, skill_dir: Path, stat: Optional[os.stat_result] = None
     ) -> Optional[SkillMetadata]:
         """
         Extract YAML frontmatter from SKILL.md.
@@ -91,11 +115,19 @@ class SkillLoader:
         Args:
             skill_md: Path to SKILL.md file
             skill_dir: Path to skill directory
+            stat: Pre-fetched stat result for skill_md, if the caller has one
 
         Returns:
             SkillMetadata if parsing succeeds, None otherwise
         """
         try:
+            if stat is None:
+                stat = skill_md.stat()
+            cache_key = (str(skill_md), stat.st_mtime_ns, stat.st_size)
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
             content = skill_md.read_text(encoding="utf-8")
 
             # Check for YAML frontmatter
@@ -111,7 +143,7 @@ class SkillLoader:
 
             # Parse YAML frontmatter
             frontmatter_yaml = parts[1].strip()
-            frontmatter = yaml.safe_load(frontmatter_yaml)
+            frontmatter = yaml.load(frontmatter_yaml, Loader=_YamlLoader)
 
             if not frontmatter:
                 logger.warning(f"skill_empty_frontmatter: file={skill_md}")
@@ -126,13 +158,15 @@ class SkillLoader:
                 return None
 
             # Create metadata with skill_path
-            return SkillMetadata(
+            metadata = SkillMetadata(
                 name=frontmatter["name"],
                 description=frontmatter["description"],
                 version=frontmatter.get("version", "1.0.0"),
                 author=frontmatter.get("author", ""),
                 skill_path=skill_dir,
             )
+            _PARSE_CACHE[cache_key] = metadata
+            return metadata
 
         except yaml.YAMLError as e:
             logger.error(f"skill_yaml_parse_error: file={skill_md}, error={str(e)}")
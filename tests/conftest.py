@@ -0,0 +1,124 @@
+"""Shared fixtures for the test suite."""
+
+import string
+
+import pytest
+from pathlib import Path
+
+from src.skill_loader import SkillLoader
+
+
+SINGLE_SKILL_MD = """---
+name: test_skill
+description: A test skill for unit testing
+version: 1.0.0
+author: Test Author
+---
+
+# Test Skill
+
+This is a test skill.
+"""
+
+BAD_SKILL_MD = """---
+name: bad_skill
+description: [invalid yaml
+version: 1.0.0
+---
+
+# Bad Skill
+"""
+
+NO_FRONTMATTER_MD = """# Skill Without Frontmatter
+
+This skill has no YAML frontmatter.
+"""
+
+INCOMPLETE_SKILL_MD = """---
+name: incomplete_skill
+version: 1.0.0
+---
+
+# Incomplete Skill
+
+Missing description field.
+"""
+
+# Parsed once at import; cheaper than re-interpolating an f-string per skill
+SKILL_TEMPLATE = string.Template(
+    """---
+name: $name
+description: $description
+version: $version
+$author_line---
+
+# $title Skill
+"""
+)
+
+# name -> (description, version, author) for the multi-skill tree
+MULTI_SKILLS = {
+    "weather": ("Get weather information for locations", "2.0.0", "Weather Team"),
+    "calendar": ("Manage calendar events", "1.0.0", ""),
+    "todo": ("Track todo items", "1.0.0", ""),
+}
+
+# Bodies pre-encoded once at import so the session fixtures can write_bytes
+# without a per-file UTF-8 encode pass
+_SINGLE_SKILL_BYTES = SINGLE_SKILL_MD.encode("utf-8")
+_MULTI_SKILL_BYTES = {
+    name: SKILL_TEMPLATE.substitute(
+        name=name,
+        description=description,
+        version=version,
+        author_line=f"author: {author}\n" if author else "",
+        title=name.title(),
+    ).encode("utf-8")
+    for name, (description, version, author) in MULTI_SKILLS.items()
+}
+
+
+@pytest.fixture(scope="session")
+def single_skill_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Skills root containing one well-formed skill, built once per session.
+
+    Tests that only read the tree share this fixture instead of re-writing
+    SKILL.md per test; each test still constructs its own SkillLoader.
+    """
+    root = tmp_path_factory.mktemp("skills_single")
+    skill_dir = root / "test_skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_bytes(_SINGLE_SKILL_BYTES)
+    return root
+
+
+@pytest.fixture(scope="session")
+def multi_skill_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Skills root with weather/calendar/todo skills, built once per session.
+
+    Backs the multi-skill discovery and metadata-prompt tests.
+    """
+    root = tmp_path_factory.mktemp("skills_multi")
+    for name, body in _MULTI_SKILL_BYTES.items():
+        skill_dir = root / name
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_bytes(body)
+    return root
+
+
+@pytest.fixture(scope="session")
+def discovered_single(single_skill_dir: Path) -> SkillLoader:
+    """SkillLoader already populated from the single-skill tree."""
+    loader = SkillLoader(single_skill_dir)
+    loader.discover_skills()
+    return loader
+
+
+@pytest.fixture(scope="session")
+def discovered_multi(multi_skill_dir: Path) -> SkillLoader:
+    """SkillLoader already populated from the multi-skill tree."""
+    loader = SkillLoader(multi_skill_dir)
+    loader.discover_skills()
+    return loader
@@ -1,8 +1,8 @@
 """Integration tests for the skill-based agent."""
 
 import pytest
+import pytest_asyncio
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from dataclasses import dataclass, field
 from typing import Optional, Dict
 
@@ -55,6 +55,49 @@ class MockContext:
     deps: MockDependencies = field(default_factory=MockDependencies)
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_deps() -> MockDependencies:
+    """
+    Session-scoped initialized dependencies shared across read-only tests.
+
+    Skill discovery walks the filesystem and parses every SKILL.md; doing it
+    once per session instead of once per test keeps the suite fast. Tests
+    that mutate state must build their own MockDependencies instead.
+    """
+    deps = MockDependencies(settings=MockSettings())
+    await deps.initialize()
+    return deps
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def skill_file_reader(shared_deps: MockDependencies):
+    """
+    Session-scoped reader for skill resource files with a per-path cache.
+
+    Several tests read the same large reference files (best_practices.md,
+    security_checklist.md, common_antipatterns.md); caching per
+    (skill_name, file_path) means each file hits the disk once per session.
+    """
+    from src.skill_tools import read_skill_file
+
+    ctx = MockContext(deps=shared_deps)
+    cache: Dict[tuple, str] = {}
+
+    async def read(skill_name: str, file_path: str) -> str:
+        key = (skill_name, file_path)
+        if key not in cache:
+            cache[key] = await read_skill_file(ctx, skill_name, file_path)
+        return cache[key]
+
+    return read
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def system_prompt(shared_deps: MockDependencies) -> str:
+    """Session-cached system prompt, generated once from the shared deps."""
+    return await get_system_prompt(MockContext(deps=shared_deps))
+
+
 class TestAgentToolRegistration:
     """Tests for agent tool registration."""
 
@@ -110,77 +153,36 @@ class TestSystemPromptGeneration:
     """Tests for dynamic system prompt generation."""
 
     @pytest.mark.asyncio
-    async def test_system_prompt_includes_weather_skill(self) -> None:
-        """Verify system prompt includes weather skill metadata."""
-        # Create mock context with real skill loader
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        # Call the system prompt function
-        prompt = await get_system_prompt(ctx)
-
-        assert "weather" in prompt.lower()
-
-    @pytest.mark.asyncio
-    async def test_system_prompt_includes_code_review_skill(self) -> None:
-        """Verify system prompt includes code_review skill metadata."""
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        prompt = await get_system_prompt(ctx)
-
-        assert "code_review" in prompt.lower()
-
-    @pytest.mark.asyncio
-    async def test_system_prompt_contains_skill_descriptions(self) -> None:
-        """Verify system prompt contains skill descriptions."""
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        prompt = await get_system_prompt(ctx)
-
-        # Check for actual skill descriptions
-        assert "weather" in prompt.lower()
-        assert "review" in prompt.lower() or "code" in prompt.lower()
+    @pytest.mark.parametrize("needle", ["weather", "code_review", "review"])
+    async def test_system_prompt_contains_skill_metadata(
+        self, system_prompt: str, needle: str
+    ) -> None:
+        """Verify the generated prompt mentions each skill name/description."""
+        assert needle in system_prompt.lower()
 
 
 class TestSkillDiscoveryIntegration:
     """Integration tests for skill discovery with the agent."""
 
     @pytest.mark.asyncio
-    async def test_both_skills_discovered(self) -> None:
+    async def test_both_skills_discovered(self, shared_deps: MockDependencies) -> None:
         """Verify both weather and code_review skills are discovered."""
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        skill_names = list(mock_deps.skill_loader.skills.keys())
+        skill_names = list(shared_deps.skill_loader.skills.keys())
 
         assert "weather" in skill_names
         assert "code_review" in skill_names
 
     @pytest.mark.asyncio
-    async def test_skill_count_at_least_five(self) -> None:
+    async def test_skill_count_at_least_five(self, shared_deps: MockDependencies) -> None:
         """Verify at least 5 skills are discovered."""
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        skill_count = len(mock_deps.skill_loader.skills)
+        skill_count = len(shared_deps.skill_loader.skills)
 
         assert skill_count >= 5, f"Expected at least 5 skills, got {skill_count}"
 
     @pytest.mark.asyncio
-    async def test_all_five_skills_discovered(self) -> None:
+    async def test_all_five_skills_discovered(self, shared_deps: MockDependencies) -> None:
         """Verify all 5 skills are discovered."""
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        skill_names = list(mock_deps.skill_loader.skills.keys())
+        skill_names = list(shared_deps.skill_loader.skills.keys())
 
         assert "weather" in skill_names
         assert "code_review" in skill_names
@@ -189,60 +191,45 @@ class TestSkillDiscoveryIntegration:
         assert "world_clock" in skill_names
 
     @pytest.mark.asyncio
-    async def test_weather_skill_has_correct_metadata(self) -> None:
+    async def test_weather_skill_has_correct_metadata(self, shared_deps: MockDependencies) -> None:
         """Verify weather skill has expected metadata."""
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        weather_skill = mock_deps.skill_loader.skills.get("weather")
+        weather_skill = shared_deps.skill_loader.skills.get("weather")
 
         assert weather_skill is not None
         assert weather_skill.name == "weather"
         assert "weather" in weather_skill.description.lower()
 
     @pytest.mark.asyncio
-    async def test_code_review_skill_has_correct_metadata(self) -> None:
+    async def test_code_review_skill_has_correct_metadata(self, shared_deps: MockDependencies) -> None:
         """Verify code_review skill has expected metadata."""
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        code_review_skill = mock_deps.skill_loader.skills.get("code_review")
+        code_review_skill = shared_deps.skill_loader.skills.get("code_review")
 
         assert code_review_skill is not None
         assert code_review_skill.name == "code_review"
         assert "review" in code_review_skill.description.lower() or "code" in code_review_skill.description.lower()
 
     @pytest.mark.asyncio
-    async def test_research_assistant_skill_has_correct_metadata(self) -> None:
+    async def test_research_assistant_skill_has_correct_metadata(self, shared_deps: MockDependencies) -> None:
         """Verify research_assistant skill has expected metadata."""
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        skill = mock_deps.skill_loader.skills.get("research_assistant")
+        skill = shared_deps.skill_loader.skills.get("research_assistant")
 
         assert skill is not None
         assert skill.name == "research_assistant"
         assert "research" in skill.description.lower() or "paper" in skill.description.lower()
 
     @pytest.mark.asyncio
-    async def test_recipe_finder_skill_has_correct_metadata(self) -> None:
+    async def test_recipe_finder_skill_has_correct_metadata(self, shared_deps: MockDependencies) -> None:
         """Verify recipe_finder skill has expected metadata."""
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        skill = mock_deps.skill_loader.skills.get("recipe_finder")
+        skill = shared_deps.skill_loader.skills.get("recipe_finder")
 
         assert skill is not None
         assert skill.name == "recipe_finder"
         assert "recipe" in skill.description.lower() or "food" in skill.description.lower()
 
     @pytest.mark.asyncio
-    async def test_world_clock_skill_has_correct_metadata(self) -> None:
+    async def test_world_clock_skill_has_correct_metadata(self, shared_deps: MockDependencies) -> None:
         """Verify world_clock skill has expected metadata."""
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        skill = mock_deps.skill_loader.skills.get("world_clock")
+        skill = shared_deps.skill_loader.skills.get("world_clock")
 
         assert skill is not None
         assert skill.name == "world_clock"
@@ -253,14 +240,11 @@ class TestLoadSkillToolIntegration:
     """Integration tests for load_skill_tool."""
 
     @pytest.mark.asyncio
-    async def test_load_weather_skill_returns_instructions(self) -> None:
+    async def test_load_weather_skill_returns_instructions(self, shared_deps: MockDependencies) -> None:
         """Test loading weather skill returns skill instructions."""
         from src.skill_tools import load_skill
 
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
+        ctx = MockContext(deps=shared_deps)
 
         result = await load_skill(ctx, "weather")
 
@@ -269,14 +253,11 @@ class TestLoadSkillToolIntegration:
         assert "Open-Meteo" in result or "weather" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_load_code_review_skill_returns_instructions(self) -> None:
+    async def test_load_code_review_skill_returns_instructions(self, shared_deps: MockDependencies) -> None:
         """Test loading code_review skill returns skill instructions."""
         from src.skill_tools import load_skill
 
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
+        ctx = MockContext(deps=shared_deps)
 
         result = await load_skill(ctx, "code_review")
 
@@ -285,14 +266,11 @@ class TestLoadSkillToolIntegration:
         assert "reference" in result.lower() or "best_practices" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_load_nonexistent_skill_returns_error(self) -> None:
+    async def test_load_nonexistent_skill_returns_error(self, shared_deps: MockDependencies) -> None:
         """Test loading nonexistent skill returns error message."""
         from src.skill_tools import load_skill
 
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
+        ctx = MockContext(deps=shared_deps)
 
         result = await load_skill(ctx, "nonexistent_skill")
 
@@ -300,14 +278,11 @@ class TestLoadSkillToolIntegration:
         assert "not found" in result
 
     @pytest.mark.asyncio
-    async def test_load_research_assistant_skill_returns_instructions(self) -> None:
+    async def test_load_research_assistant_skill_returns_instructions(self, shared_deps: MockDependencies) -> None:
         """Test loading research_assistant skill returns skill instructions."""
         from src.skill_tools import load_skill
 
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
+        ctx = MockContext(deps=shared_deps)
 
         result = await load_skill(ctx, "research_assistant")
 
@@ -315,14 +290,11 @@ class TestLoadSkillToolIntegration:
         assert "Semantic Scholar" in result or "paper" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_load_recipe_finder_skill_returns_instructions(self) -> None:
+    async def test_load_recipe_finder_skill_returns_instructions(self, shared_deps: MockDependencies) -> None:
         """Test loading recipe_finder skill returns skill instructions."""
         from src.skill_tools import load_skill
 
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
+        ctx = MockContext(deps=shared_deps)
 
         result = await load_skill(ctx, "recipe_finder")
 
@@ -330,14 +302,11 @@ class TestLoadSkillToolIntegration:
         assert "ingredient" in result.lower() or "meal" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_load_world_clock_skill_returns_instructions(self) -> None:
+    async def test_load_world_clock_skill_returns_instructions(self, shared_deps: MockDependencies) -> None:
         """Test loading world_clock skill returns skill instructions."""
         from src.skill_tools import load_skill
 
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
+        ctx = MockContext(deps=shared_deps)
 
         result = await load_skill(ctx, "world_clock")
 
@@ -349,101 +318,52 @@ class TestReadSkillFileIntegration:
     """Integration tests for read_skill_file_tool."""
 
     @pytest.mark.asyncio
-    async def test_read_weather_api_reference(self) -> None:
+    async def test_read_weather_api_reference(self, skill_file_reader) -> None:
         """Test reading weather skill's API reference file."""
-        from src.skill_tools import read_skill_file
-
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        result = await read_skill_file(ctx, "weather", "references/api_reference.md")
+        result = await skill_file_reader("weather", "references/api_reference.md")
 
         assert "Open-Meteo" in result or "API" in result
 
     @pytest.mark.asyncio
-    async def test_read_code_review_best_practices(self) -> None:
+    async def test_read_code_review_best_practices(self, skill_file_reader) -> None:
         """Test reading code_review skill's best practices file."""
-        from src.skill_tools import read_skill_file
-
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        result = await read_skill_file(ctx, "code_review", "references/best_practices.md")
+        result = await skill_file_reader("code_review", "references/best_practices.md")
 
         assert "Best Practices" in result or "best practices" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_read_code_review_security_checklist(self) -> None:
+    async def test_read_code_review_security_checklist(self, skill_file_reader) -> None:
         """Test reading code_review skill's security checklist file."""
-        from src.skill_tools import read_skill_file
-
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        result = await read_skill_file(ctx, "code_review", "references/security_checklist.md")
+        result = await skill_file_reader("code_review", "references/security_checklist.md")
 
         assert "Security" in result or "security" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_read_nonexistent_file_returns_error(self) -> None:
+    async def test_read_nonexistent_file_returns_error(self, skill_file_reader) -> None:
         """Test reading nonexistent file returns error message."""
-        from src.skill_tools import read_skill_file
-
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        result = await read_skill_file(ctx, "weather", "nonexistent.md")
+        result = await skill_file_reader("weather", "nonexistent.md")
 
         assert "Error" in result
         assert "not found" in result
 
     @pytest.mark.asyncio
-    async def test_read_research_assistant_api_reference(self) -> None:
+    async def test_read_research_assistant_api_reference(self, skill_file_reader) -> None:
         """Test reading research_assistant skill's API reference file."""
-        from src.skill_tools import read_skill_file
-
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        result = await read_skill_file(ctx, "research_assistant", "references/api_reference.md")
+        result = await skill_file_reader("research_assistant", "references/api_reference.md")
 
         assert "Semantic Scholar" in result or "API" in result
 
     @pytest.mark.asyncio
-    async def test_read_recipe_finder_api_reference(self) -> None:
+    async def test_read_recipe_finder_api_reference(self, skill_file_reader) -> None:
         """Test reading recipe_finder skill's API reference file."""
-        from src.skill_tools import read_skill_file
-
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        result = await read_skill_file(ctx, "recipe_finder", "references/api_reference.md")
+        result = await skill_file_reader("recipe_finder", "references/api_reference.md")
 
         assert "MealDB" in result or "Spoonacular" in result or "recipe" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_read_recipe_finder_dietary_guide(self) -> None:
+    async def test_read_recipe_finder_dietary_guide(self, skill_file_reader) -> None:
         """Test reading recipe_finder skill's dietary guide file."""
-        from src.skill_tools import read_skill_file
-
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        result = await read_skill_file(ctx, "recipe_finder", "references/dietary_guide.md")
+        result = await skill_file_reader("recipe_finder", "references/dietary_guide.md")
 
         assert "diet" in result.lower() or "vegetarian" in result.lower()
 
@@ -452,14 +372,11 @@ class TestListSkillFilesIntegration:
     """Integration tests for list_skill_files_tool."""
 
     @pytest.mark.asyncio
-    async def test_list_weather_skill_files(self) -> None:
+    async def test_list_weather_skill_files(self, shared_deps: MockDependencies) -> None:
         """Test listing files in weather skill."""
         from src.skill_tools import list_skill_files
 
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
+        ctx = MockContext(deps=shared_deps)
 
         result = await list_skill_files(ctx, "weather")
 
@@ -467,14 +384,11 @@ class TestListSkillFilesIntegration:
         assert "api_reference.md" in result
 
     @pytest.mark.asyncio
-    async def test_list_code_review_skill_files(self) -> None:
+    async def test_list_code_review_skill_files(self, shared_deps: MockDependencies) -> None:
         """Test listing files in code_review skill."""
         from src.skill_tools import list_skill_files
 
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
+        ctx = MockContext(deps=shared_deps)
 
         result = await list_skill_files(ctx, "code_review")
 
@@ -484,14 +398,11 @@ class TestListSkillFilesIntegration:
         assert "common_antipatterns.md" in result
 
     @pytest.mark.asyncio
-    async def test_list_research_assistant_skill_files(self) -> None:
+    async def test_list_research_assistant_skill_files(self, shared_deps: MockDependencies) -> None:
         """Test listing files in research_assistant skill."""
         from src.skill_tools import list_skill_files
 
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
+        ctx = MockContext(deps=shared_deps)
 
         result = await list_skill_files(ctx, "research_assistant")
 
@@ -500,14 +411,11 @@ class TestListSkillFilesIntegration:
         assert "search_tips.md" in result
 
     @pytest.mark.asyncio
-    async def test_list_recipe_finder_skill_files(self) -> None:
+    async def test_list_recipe_finder_skill_files(self, shared_deps: MockDependencies) -> None:
         """Test listing files in recipe_finder skill."""
         from src.skill_tools import list_skill_files
 
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
+        ctx = MockContext(deps=shared_deps)
 
         result = await list_skill_files(ctx, "recipe_finder")
 
@@ -516,14 +424,11 @@ class TestListSkillFilesIntegration:
         assert "dietary_guide.md" in result
 
     @pytest.mark.asyncio
-    async def test_list_world_clock_skill_files(self) -> None:
+    async def test_list_world_clock_skill_files(self, shared_deps: MockDependencies) -> None:
         """Test listing files in world_clock skill."""
         from src.skill_tools import list_skill_files
 
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
+        ctx = MockContext(deps=shared_deps)
 
         result = await list_skill_files(ctx, "world_clock")
 
@@ -534,46 +439,25 @@ class TestReferenceFileSizes:
     """Tests to verify reference files have substantial content."""
 
     @pytest.mark.asyncio
-    async def test_best_practices_file_size(self) -> None:
+    async def test_best_practices_file_size(self, skill_file_reader) -> None:
         """Verify best_practices.md is substantial (~10KB+)."""
-        from src.skill_tools import read_skill_file
-
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        content = await read_skill_file(ctx, "code_review", "references/best_practices.md")
+        content = await skill_file_reader("code_review", "references/best_practices.md")
 
         # Should be at least 8KB
         assert len(content) >= 8000, f"best_practices.md too small: {len(content)} bytes"
 
     @pytest.mark.asyncio
-    async def test_security_checklist_file_size(self) -> None:
+    async def test_security_checklist_file_size(self, skill_file_reader) -> None:
         """Verify security_checklist.md is substantial (~15KB+)."""
-        from src.skill_tools import read_skill_file
-
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        content = await read_skill_file(ctx, "code_review", "references/security_checklist.md")
+        content = await skill_file_reader("code_review", "references/security_checklist.md")
 
         # Should be at least 12KB
         assert len(content) >= 12000, f"security_checklist.md too small: {len(content)} bytes"
 
     @pytest.mark.asyncio
-    async def test_common_antipatterns_file_size(self) -> None:
+    async def test_common_antipatterns_file_size(self, skill_file_reader) -> None:
         """Verify common_antipatterns.md is substantial (~20KB+)."""
-        from src.skill_tools import read_skill_file
-
-        mock_deps = MockDependencies(settings=MockSettings())
-        await mock_deps.initialize()
-
-        ctx = MockContext(deps=mock_deps)
-
-        content = await read_skill_file(ctx, "code_review", "references/common_antipatterns.md")
+        content = await skill_file_reader("code_review", "references/common_antipatterns.md")
 
         # Should be at least 15KB
         assert len(content) >= 15000, f"common_antipatterns.md too small: {len(content)} bytes"
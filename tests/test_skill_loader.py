@@ -2,9 +2,14 @@
 
 import pytest
 from pathlib import Path
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from src.skill_loader import SkillLoader, SkillMetadata
+from src.skill_loader import SkillLoader, SkillMetadata, clear_parse_cache
+from tests.conftest import BAD_SKILL_MD, INCOMPLETE_SKILL_MD, NO_FRONTMATTER_MD
+
+# Built once at import; validate_python reuses the compiled validator
+# instead of rebuilding it per instantiation.
+META_ADAPTER = TypeAdapter(SkillMetadata)
 
 
 class TestSkillMetadata:
@@ -12,12 +17,14 @@ class TestSkillMetadata:
 
     def test_skill_metadata_model_validation(self, tmp_path: Path) -> None:
         """Test that SkillMetadata accepts valid input."""
-        metadata = SkillMetadata(
-            name="test_skill",
-            description="A test skill for validation",
-            version="1.0.0",
-            author="Test Author",
-            skill_path=tmp_path,
+        metadata = META_ADAPTER.validate_python(
+            {
+                "name": "test_skill",
+                "description": "A test skill for validation",
+                "version": "1.0.0",
+                "author": "Test Author",
+                "skill_path": tmp_path,
+            }
         )
 
         assert metadata.name == "test_skill"
@@ -28,10 +35,12 @@ class TestSkillMetadata:
 
     def test_skill_metadata_default_values(self, tmp_path: Path) -> None:
         """Test that SkillMetadata uses defaults for optional fields."""
-        metadata = SkillMetadata(
-            name="minimal_skill",
-            description="Minimal description",
-            skill_path=tmp_path,
+        metadata = META_ADAPTER.validate_python(
+            {
+                "name": "minimal_skill",
+                "description": "Minimal description",
+                "skill_path": tmp_path,
+            }
         )
 
         assert metadata.version == "1.0.0"
@@ -41,250 +50,135 @@ class TestSkillMetadata:
         """Test that SkillMetadata raises ValidationError for missing required fields."""
         # Missing name
         with pytest.raises(ValidationError):
-            SkillMetadata(description="Test", skill_path=tmp_path)
+            META_ADAPTER.validate_python({"description": "Test", "skill_path": tmp_path})
 
         # Missing description
         with pytest.raises(ValidationError):
-            SkillMetadata(name="test", skill_path=tmp_path)
+            META_ADAPTER.validate_python({"name": "test", "skill_path": tmp_path})
 
         # Missing skill_path
         with pytest.raises(ValidationError):
-            SkillMetadata(name="test", description="Test")
+            META_ADAPTER.validate_python({"name": "test", "description": "Test"})
 
 
 class TestSkillLoader:
     """Tests for SkillLoader class."""
 
-    def test_skill_loader_discovers_skills(self, tmp_path: Path) -> None:
+    def test_skill_loader_discovers_skills(
+        self, single_skill_dir: Path, discovered_single: SkillLoader
+    ) -> None:
         """Test that SkillLoader discovers skills from directory."""
-        # Create test skill
-        skill_dir = tmp_path / "test_skill"
-        skill_dir.mkdir()
-
-        skill_md = skill_dir / "SKILL.md"
-        skill_md.write_text(
-            """---
-name: test_skill
-description: A test skill for unit testing
-version: 1.0.0
-author: Test Author
----
-
-# Test Skill
-
-This is a test skill.
-"""
-        )
-
-        # Test discovery
-        loader = SkillLoader(tmp_path)
-        skills = loader.discover_skills()
+        skills = list(discovered_single.skills.values())
 
         assert len(skills) == 1
         assert skills[0].name == "test_skill"
         assert skills[0].description == "A test skill for unit testing"
         assert skills[0].version == "1.0.0"
         assert skills[0].author == "Test Author"
-        assert skills[0].skill_path == skill_dir
+        assert skills[0].skill_path == single_skill_dir / "test_skill"
 
-    def test_skill_loader_empty_directory(self, tmp_path: Path) -> None:
+    def test_skill_loader_empty_directory(self, fs) -> None:
         """Test that empty skills directory returns empty list."""
-        loader = SkillLoader(tmp_path)
+        fs.create_dir("/skills")
+        loader = SkillLoader(Path("/skills"))
         skills = loader.discover_skills()
 
         assert len(skills) == 0
 
-    def test_skill_loader_missing_directory(self, tmp_path: Path) -> None:
+    def test_skill_loader_missing_directory(self, fs) -> None:
         """Test that missing skills directory returns empty list."""
-        nonexistent = tmp_path / "nonexistent"
-        loader = SkillLoader(nonexistent)
+        loader = SkillLoader(Path("/skills/nonexistent"))
         skills = loader.discover_skills()
 
         assert len(skills) == 0
 
-    def test_skill_loader_parses_frontmatter(self, tmp_path: Path) -> None:
+    def test_skill_loader_parses_frontmatter(self, discovered_multi: SkillLoader) -> None:
         """Test that SkillLoader correctly parses YAML frontmatter."""
-        skill_dir = tmp_path / "weather"
-        skill_dir.mkdir()
-
-        skill_md = skill_dir / "SKILL.md"
-        skill_md.write_text(
-            """---
-name: weather
-description: Get weather information for locations
-version: 2.0.0
-author: Weather Team
----
-
-# Weather Skill
-
-Provides weather information.
-
-## Instructions
-
-Ask for a location to get weather data.
-"""
-        )
-
-        loader = SkillLoader(tmp_path)
-        skills = loader.discover_skills()
-
-        assert len(skills) == 1
-        skill = skills[0]
+        skill = discovered_multi.skills["weather"]
         assert skill.name == "weather"
         assert skill.description == "Get weather information for locations"
         assert skill.version == "2.0.0"
         assert skill.author == "Weather Team"
 
-    def test_skill_loader_generates_metadata_prompt(self, tmp_path: Path) -> None:
+    def test_skill_loader_generates_metadata_prompt(
+        self, discovered_multi: SkillLoader
+    ) -> None:
         """Test that get_skill_metadata_prompt generates correct format."""
-        # Create two skills
-        for name, desc in [
-            ("weather", "Get weather data"),
-            ("calendar", "Manage calendar events"),
-        ]:
-            skill_dir = tmp_path / name
-            skill_dir.mkdir()
-            skill_md = skill_dir / "SKILL.md"
-            skill_md.write_text(
-                f"""---
-name: {name}
-description: {desc}
----
-
-# {name.title()} Skill
-"""
-            )
-
-        loader = SkillLoader(tmp_path)
-        loader.discover_skills()
-
-        prompt = loader.get_skill_metadata_prompt()
+        prompt = discovered_multi.get_skill_metadata_prompt()
 
         assert "weather" in prompt
-        assert "Get weather data" in prompt
+        assert "Get weather information for locations" in prompt
         assert "calendar" in prompt
         assert "Manage calendar events" in prompt
         assert "**weather**" in prompt or "**calendar**" in prompt
 
-    def test_skill_loader_handles_malformed_frontmatter(self, tmp_path: Path) -> None:
-        """Test graceful handling of malformed YAML frontmatter."""
-        skill_dir = tmp_path / "bad_skill"
-        skill_dir.mkdir()
-
-        skill_md = skill_dir / "SKILL.md"
-        skill_md.write_text(
-            """---
-name: bad_skill
-description: [invalid yaml
-version: 1.0.0
----
-
-# Bad Skill
-"""
-        )
-
-        loader = SkillLoader(tmp_path)
-        skills = loader.discover_skills()
-
-        # Should skip the malformed skill
-        assert len(skills) == 0
-
-    def test_skill_loader_handles_missing_frontmatter(self, tmp_path: Path) -> None:
-        """Test handling of SKILL.md without frontmatter."""
-        skill_dir = tmp_path / "no_frontmatter"
-        skill_dir.mkdir()
-
-        skill_md = skill_dir / "SKILL.md"
-        skill_md.write_text(
-            """# Skill Without Frontmatter
-
-This skill has no YAML frontmatter.
-"""
-        )
+    @pytest.mark.parametrize(
+        "content",
+        [BAD_SKILL_MD, NO_FRONTMATTER_MD, INCOMPLETE_SKILL_MD],
+        ids=["bad", "no_frontmatter", "incomplete"],
+    )
+    def test_skill_loader_rejects_bad_skill_md(self, fs, content: str) -> None:
+        """Test that malformed, frontmatter-less, and incomplete SKILL.md files are skipped."""
+        fs.create_file("/skills/bad_skill/SKILL.md", contents=content)
 
-        loader = SkillLoader(tmp_path)
+        loader = SkillLoader(Path("/skills"))
         skills = loader.discover_skills()
 
-        # Should skip skill without frontmatter
         assert len(skills) == 0
 
-    def test_skill_loader_handles_missing_required_fields(self, tmp_path: Path) -> None:
-        """Test handling of frontmatter missing required fields."""
-        skill_dir = tmp_path / "incomplete_skill"
-        skill_dir.mkdir()
-
-        skill_md = skill_dir / "SKILL.md"
-        skill_md.write_text(
-            """---
-name: incomplete_skill
-version: 1.0.0
----
-
-# Incomplete Skill
-
-Missing description field.
-"""
-        )
+    def test_skill_loader_discovers_multiple_skills(
+        self, discovered_multi: SkillLoader
+    ) -> None:
+        """Test discovery of multiple skills."""
+        assert len(discovered_multi.skills) == 3
+        discovered_names = set(discovered_multi.skills)
+        assert discovered_names == {"weather", "calendar", "todo"}
 
-        loader = SkillLoader(tmp_path)
-        skills = loader.discover_skills()
+    def test_skill_loader_skills_dict_populated(self, single_skill_dir: Path) -> None:
+        """Test that skills dictionary is populated after discovery."""
+        loader = SkillLoader(single_skill_dir)
+        loader.discover_skills()
 
-        # Should skip skill with missing required fields
-        assert len(skills) == 0
+        assert "test_skill" in loader.skills
+        assert loader.skills["test_skill"].name == "test_skill"
 
-    def test_skill_loader_discovers_multiple_skills(self, tmp_path: Path) -> None:
-        """Test discovery of multiple skills."""
-        skill_names = ["weather", "calendar", "todo"]
-
-        for name in skill_names:
-            skill_dir = tmp_path / name
-            skill_dir.mkdir()
-            skill_md = skill_dir / "SKILL.md"
-            skill_md.write_text(
-                f"""---
-name: {name}
-description: {name.title()} skill description
----
+    def test_skill_loader_empty_prompt_when_no_skills(self, fs) -> None:
+        """Test get_skill_metadata_prompt when no skills discovered."""
+        fs.create_dir("/skills")
+        loader = SkillLoader(Path("/skills"))
+        loader.discover_skills()
 
-# {name.title()} Skill
-"""
-            )
+        prompt = loader.get_skill_metadata_prompt()
 
-        loader = SkillLoader(tmp_path)
-        skills = loader.discover_skills()
+        assert "No skills" in prompt or prompt == "No skills currently available."
 
-        assert len(skills) == 3
-        discovered_names = {s.name for s in skills}
-        assert discovered_names == set(skill_names)
 
-    def test_skill_loader_skills_dict_populated(self, tmp_path: Path) -> None:
-        """Test that skills dictionary is populated after discovery."""
-        skill_dir = tmp_path / "test_skill"
+def test_discover_100_skills_benchmark(
+    tmp_path_factory: pytest.TempPathFactory, benchmark
+) -> None:
+    """Benchmark discover_skills over a 100-skill tree to catch regressions."""
+    root = tmp_path_factory.mktemp("many_skills")
+    for i in range(100):
+        skill_dir = root / f"skill_{i}"
         skill_dir.mkdir()
-
-        skill_md = skill_dir / "SKILL.md"
-        skill_md.write_text(
-            """---
-name: test_skill
-description: Test skill
+        (skill_dir / "SKILL.md").write_text(
+            f"""---
+name: skill_{i}
+description: Benchmark skill {i}
 ---
 
-# Test Skill
+# Skill {i}
 """
         )
 
-        loader = SkillLoader(tmp_path)
-        loader.discover_skills()
+    loader = SkillLoader(root)
 
-        assert "test_skill" in loader.skills
-        assert loader.skills["test_skill"].name == "test_skill"
+    def _cold_setup() -> tuple:
+        # Drop the frontmatter cache so every round measures the full
+        # read + YAML parse + validation path, not a cache hit
+        clear_parse_cache()
+        return (), {}
 
-    def test_skill_loader_empty_prompt_when_no_skills(self, tmp_path: Path) -> None:
-        """Test get_skill_metadata_prompt when no skills discovered."""
-        loader = SkillLoader(tmp_path)
-        loader.discover_skills()
-
-        prompt = loader.get_skill_metadata_prompt()
+    result = benchmark.pedantic(loader.discover_skills, setup=_cold_setup, rounds=20)
 
-        assert "No skills" in prompt or prompt == "No skills currently available."
+    assert len(result) == 100
@@ -2,7 +2,6 @@
 
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, MagicMock
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 